@@ -8,28 +8,47 @@ This module serves as the main entry point for the Flask application and defines
 all API endpoints, middleware, and request handlers.
 """
 
+import hashlib
 import logging
 import os
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from functools import wraps
-from typing import Dict, Any, Tuple, Callable
+from typing import Tuple, Callable
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Blueprint, Flask, Response, request, jsonify
+from flask.typing import ResponseReturnValue
 from flask_cors import CORS
+from werkzeug.routing import PathConverter
+from whitenoise import WhiteNoise
+
+# Try importing flask-compress (may not be available)
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+    Compress = None  # type: ignore
 
 from config import Config
 from constants import (
     MAX_TWEET_LENGTH,
+    MAX_REQUEST_BODY_BYTES,
     REQUIRED_CREDENTIAL_FIELDS,
+    REQUIRED_CREDENTIAL_FIELDS_SET,
     MAX_REPLIES_TO_FETCH,
+    TWITTER_API_WORKERS,
 )
-from errors import friendly_error_message
+from errors import error_matches, friendly_error_message
+from serialization import JSONProvider, dumps
 from session_manager import session_manager
 from progress_manager import progress_manager
 from twitter_client import TwitterClientManager
 from utils import (
     extract_thread_id_from_url,
-    extract_day_from_text,
+    extract_highest_day,
+    format_solution_tweet,
     validate_tweet_length,
     validate_thread_id,
 )
@@ -40,16 +59,181 @@ logger = logging.getLogger(__name__)
 
 # Initialize Flask app
 app = Flask(__name__, static_folder=None)
+app.json = JSONProvider(app)
 app.config["SECRET_KEY"] = Config.SECRET_KEY
+# Request bodies are small JSON documents; reject anything larger before parsing
+app.config["MAX_CONTENT_LENGTH"] = MAX_REQUEST_BODY_BYTES
 
 
 cors_origins = Config.get_cors_origins()
 CORS(app, supports_credentials=True, origins=cors_origins if cors_origins else "*")
 
+# Gzip JSON responses big enough to benefit; static files are handled by WhiteNoise
+if COMPRESS_AVAILABLE:
+    app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+    app.config["COMPRESS_LEVEL"] = 6
+    app.config["COMPRESS_MIN_SIZE"] = 500
+    Compress(app)
+
 
 if Config.FRONTEND_DIST_PATH.exists():
     app.static_folder = str(Config.FRONTEND_DIST_PATH)
 
+# Shared pool for running independent (blocking) Twitter API calls concurrently
+twitter_executor = ThreadPoolExecutor(
+    max_workers=TWITTER_API_WORKERS, thread_name_prefix="twitter-api"
+)
+
+
+# ============== PRE-SERIALIZED RESPONSES ==============
+
+# Constant error payloads on hot failure paths are encoded once at import
+_NO_SESSION_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "NO_SESSION",
+        "message": "Please configure your settings first to start using the app.",
+    }
+)
+_SESSION_EXPIRED_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "SESSION_EXPIRED",
+        "message": "Your session has expired. Please reconfigure your API keys.",
+    }
+)
+_INVALID_CREDENTIALS_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "INVALID_CREDENTIALS",
+        "message": "Unable to decrypt your credentials. Please reconfigure your API keys.",
+    }
+)
+_NOT_FOUND_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "NOT_FOUND",
+        "message": "The requested resource was not found.",
+    }
+)
+_API_NOT_FOUND_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "NOT_FOUND",
+        "message": "The requested API resource was not found.",
+    }
+)
+_REQUEST_TOO_LARGE_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "REQUEST_TOO_LARGE",
+        "message": "The request is too large. Please shorten your input and try again.",
+    }
+)
+_SERVER_ERROR_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "SERVER_ERROR",
+        "message": "An unexpected error occurred. Please try again later.",
+    }
+)
+
+# Validation failures with fixed messages
+_INVALID_DAY_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "INVALID_DAY",
+        "message": "Please provide a valid day number.",
+    }
+)
+_NEGATIVE_DAY_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "INVALID_DAY",
+        "message": "Day number must be 0 or greater.",
+    }
+)
+_NO_THREAD_TO_UPDATE_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "NO_THREAD",
+        "message": "No active thread found to update.",
+    }
+)
+_EMPTY_INTRO_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "EMPTY_CONTENT",
+        "message": "Please enter some text for your thread introduction.",
+    }
+)
+_MISSING_THREAD_IDENTIFIER_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "MISSING_THREAD_IDENTIFIER",
+        "message": "Please provide a thread ID or URL to continue.",
+    }
+)
+_INVALID_THREAD_URL_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "INVALID_THREAD_URL",
+        "message": "Invalid thread URL. Please provide a valid X/Twitter thread URL or thread ID.",
+    }
+)
+_THREAD_NOT_FOUND_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "THREAD_NOT_FOUND",
+        "message": "Thread not found. Please check the thread ID or URL.",
+    }
+)
+_NOT_OWNER_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "NOT_OWNER",
+        "message": "This thread doesn't belong to your account. Please use a thread you created.",
+    }
+)
+_MISSING_GIST_URL_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "MISSING_GIST_URL",
+        "message": "Please provide a Gist URL for your solution.",
+    }
+)
+_MISSING_PROBLEM_NAME_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "MISSING_PROBLEM_NAME",
+        "message": "Please provide the problem name.",
+    }
+)
+_NO_THREAD_BODY = dumps(
+    {
+        "success": False,
+        "error_code": "NO_THREAD",
+        "message": "No active thread found. Please start a new thread first.",
+    }
+)
+
+
+def json_response(body: bytes, status: int) -> Response:
+    """
+    Build a JSON response from a pre-serialized body.
+
+    A new Response is created per call because middleware (e.g. CORS)
+    adds headers to the response object.
+
+    Args:
+        body: Serialized JSON body.
+        status: HTTP status code.
+
+    Returns:
+        Flask response object.
+    """
+    return Response(body, status=status, mimetype="application/json")
+
 
 # ============== MIDDLEWARE & DECORATORS ==============
 
@@ -87,62 +271,29 @@ def require_credentials(f: Callable) -> Callable:
 
         if not session_id:
             logger.warning("Request missing session ID")
-            return (
-                jsonify(
-                    {
-                        "success": False,
-                        "error_code": "NO_SESSION",
-                        "message": "Please configure your settings first to start using the app.",
-                    }
-                ),
-                401,
-            )
+            return json_response(_NO_SESSION_BODY, 401)
 
-        session = session_manager.get_session(session_id)
+        # Requests that change state (tweets, progress) re-read the session,
+        # so one destroyed through another worker can't keep posting
+        session = session_manager.get_session(session_id, confirm=request.method != "GET")
         if not session:
             logger.warning(
                 f"Invalid or expired session: {session_id[:8] if session_id else 'None'}..."
             )
-            return (
-                jsonify(
-                    {
-                        "success": False,
-                        "error_code": "SESSION_EXPIRED",
-                        "message": "Your session has expired. Please reconfigure your API keys.",
-                    }
-                ),
-                401,
-            )
+            return json_response(_SESSION_EXPIRED_BODY, 401)
 
         try:
-            credentials = session_manager.get_credentials(session_id)
+            # get_session already loaded and decrypted the credentials
+            credentials = session.get("credentials")
             if not credentials:
                 logger.error(
                     f"Failed to decrypt credentials for session: {session_id[:8]}..."
                 )
-                return (
-                    jsonify(
-                        {
-                            "success": False,
-                            "error_code": "INVALID_CREDENTIALS",
-                            "message": "Unable to decrypt your credentials. Please reconfigure your API keys.",
-                        }
-                    ),
-                    401,
-                )
+                return json_response(_INVALID_CREDENTIALS_BODY, 401)
             request.twitter_credentials = credentials
         except Exception as e:
             logger.error(f"Error decrypting credentials: {e}")
-            return (
-                jsonify(
-                    {
-                        "success": False,
-                        "error_code": "INVALID_CREDENTIALS",
-                        "message": "Unable to decrypt your credentials. Please reconfigure your API keys.",
-                    }
-                ),
-                401,
-            )
+            return json_response(_INVALID_CREDENTIALS_BODY, 401)
 
         return f(*args, **kwargs)
 
@@ -151,29 +302,44 @@ def require_credentials(f: Callable) -> Callable:
 
 # ============== API ENDPOINTS ==============
 
+# All API routes live under /api, so they can never collide with SPA routes
+api = Blueprint("api", __name__, url_prefix="/api")
+
 
-@app.route("/api/health", methods=["GET"])
-def health_check() -> Tuple[Dict[str, Any], int]:
+# (epoch second, serialized body) of the last health check response
+_health_cache: Tuple[int, bytes] = (0, b"")
+
+
+@api.route("/health", methods=["GET"])
+def health_check() -> Response:
     """
     Health check endpoint for monitoring and load balancers.
 
+    The body is rebuilt at most once per second, since probes hit it often.
+
     Returns:
         JSON response with server status and timestamp.
     """
-    return (
-        jsonify(
+    global _health_cache
+
+    now = int(time.time())
+    cached_at, body = _health_cache
+    if cached_at != now:
+        body = dumps(
             {
                 "success": True,
                 "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
+                # UTC at second resolution, matching how long the body is reused
+                "timestamp": datetime.fromtimestamp(now, tz=timezone.utc).isoformat(),
             }
-        ),
-        200,
-    )
+        )
+        _health_cache = (now, body)
+
+    return json_response(body, 200)
 
 
-@app.route("/api/session/create", methods=["POST"])
-def create_session() -> Tuple[Dict[str, Any], int]:
+@api.route("/session/create", methods=["POST"])
+def create_session() -> ResponseReturnValue:
     """
     Create a new session and store encrypted credentials.
 
@@ -191,13 +357,12 @@ def create_session() -> Tuple[Dict[str, Any], int]:
         JSON response with session_id and expiry information on success,
         or error details on failure.
     """
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
 
     # Validate required fields
-    missing_fields = [
-        field for field in REQUIRED_CREDENTIAL_FIELDS if not data.get(field)
-    ]
-    if missing_fields:
+    missing = REQUIRED_CREDENTIAL_FIELDS_SET - {k for k, v in data.items() if v}
+    if missing:
+        missing_fields = [f for f in REQUIRED_CREDENTIAL_FIELDS if f in missing]
         logger.warning(f"Session creation failed: missing fields {missing_fields}")
         return (
             jsonify(
@@ -210,7 +375,8 @@ def create_session() -> Tuple[Dict[str, Any], int]:
             400,
         )
 
-    # Validate credentials by attempting to connect
+    # Validate credentials by attempting to connect; they are only stored
+    # once Twitter has accepted them
     is_valid, validation_error = TwitterClientManager.validate_credentials(data)
     if not is_valid:
         logger.warning(f"Credential validation failed: {validation_error}")
@@ -223,20 +389,7 @@ def create_session() -> Tuple[Dict[str, Any], int]:
         )
 
     try:
-        # Create session
         session_id = session_manager.create_session(data)
-        logger.info(f"Session created successfully: {session_id[:8]}...")
-
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "session_id": session_id,
-                    "message": "Successfully connected to X/Twitter! Your credentials are saved securely. You can now start posting.",
-                }
-            ),
-            200,
-        )
     except Exception as e:
         logger.error(f"Failed to create session: {e}")
         error_code, message = friendly_error_message(e)
@@ -245,9 +398,26 @@ def create_session() -> Tuple[Dict[str, Any], int]:
             500,
         )
 
+    # Validation already fetched the account, so later calls needn't
+    identity = TwitterClientManager.get_identity(data)
+    if identity:
+        session_manager.set_identity(session_id, *identity)
+
+    logger.info(f"Session created successfully: {session_id[:8]}...")
+    return (
+        jsonify(
+            {
+                "success": True,
+                "session_id": session_id,
+                "message": "Successfully connected to X/Twitter! Your credentials are saved securely. You can now start posting.",
+            }
+        ),
+        200,
+    )
+
 
-@app.route("/api/session/validate", methods=["GET"])
-def validate_session() -> Tuple[Dict[str, Any], int]:
+@api.route("/session/validate", methods=["GET"])
+def validate_session() -> ResponseReturnValue:
     """
     Validate if current session is still active.
 
@@ -268,8 +438,7 @@ def validate_session() -> Tuple[Dict[str, Any], int]:
             200,
         )
 
-    session = session_manager.get_session(session_id)
-    if not session:
+    if not session_manager.is_session_valid(session_id):
         return (
             jsonify(
                 {
@@ -293,8 +462,8 @@ def validate_session() -> Tuple[Dict[str, Any], int]:
     )
 
 
-@app.route("/api/session/destroy", methods=["DELETE"])
-def destroy_session() -> Tuple[Dict[str, Any], int]:
+@api.route("/session/destroy", methods=["DELETE"])
+def destroy_session() -> ResponseReturnValue:
     """
     Destroy current session (logout).
 
@@ -321,34 +490,45 @@ def destroy_session() -> Tuple[Dict[str, Any], int]:
     )
 
 
-@app.route("/api/progress", methods=["GET"])
+@api.route("/progress", methods=["GET"])
 @require_credentials
-def get_progress() -> Tuple[Dict[str, Any], int]:
+def get_progress() -> ResponseReturnValue:
     """
     Get current posting progress.
 
     Returns the current day number and active thread ID if available.
+    The response carries an ETag derived from the progress, so polling
+    clients get an empty 304 until it changes.
 
     Returns:
-        JSON response with progress data.
+        JSON response with progress data, or 304 Not Modified.
     """
     try:
         session_id = get_session_id()
         progress = progress_manager.load(session_id)
-        return (
-            jsonify(
+        day = progress.get("day", 0)
+        thread_id = progress.get("thread_id")
+
+        etag = f"{day}-{thread_id}"
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = jsonify(
                 {
                     "success": True,
                     "data": {
-                        "current_day": progress.get("day", 0),
-                        "thread_id": progress.get("thread_id"),
-                        "has_active_thread": progress.get("thread_id") is not None,
-                        "next_day": progress.get("day", 0) + 1,
+                        "current_day": day,
+                        "thread_id": thread_id,
+                        "has_active_thread": thread_id is not None,
+                        "next_day": day + 1,
                     },
                 }
-            ),
-            200,
-        )
+            )
+
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, max-age=0, must-revalidate"
+        response.vary.add("X-Session-ID")
+        return response
     except Exception as e:
         logger.error(f"Failed to load progress: {e}")
         error_code, message = friendly_error_message(e)
@@ -358,9 +538,9 @@ def get_progress() -> Tuple[Dict[str, Any], int]:
         )
 
 
-@app.route("/api/progress/reset", methods=["POST"])
+@api.route("/progress/reset", methods=["POST"])
 @require_credentials
-def reset_progress() -> Tuple[Dict[str, Any], int]:
+def reset_progress() -> ResponseReturnValue:
     """
     Reset progress to start a new thread.
 
@@ -390,9 +570,9 @@ def reset_progress() -> Tuple[Dict[str, Any], int]:
         )
 
 
-@app.route("/api/progress/update", methods=["POST"])
+@api.route("/progress/update", methods=["POST"])
 @require_credentials
-def update_progress() -> Tuple[Dict[str, Any], int]:
+def update_progress() -> ResponseReturnValue:
     """
     Update the current progress day for an existing thread.
 
@@ -404,34 +584,16 @@ def update_progress() -> Tuple[Dict[str, Any], int]:
     Returns:
         JSON response with updated progress data.
     """
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
     raw_day = data.get("current_day")
 
     try:
         day = int(raw_day)
     except (TypeError, ValueError):
-        return (
-            jsonify(
-                {
-                    "success": False,
-                    "error_code": "INVALID_DAY",
-                    "message": "Please provide a valid day number.",
-                }
-            ),
-            400,
-        )
+        return json_response(_INVALID_DAY_BODY, 400)
 
     if day < 0:
-        return (
-            jsonify(
-                {
-                    "success": False,
-                    "error_code": "INVALID_DAY",
-                    "message": "Day number must be 0 or greater.",
-                }
-            ),
-            400,
-        )
+        return json_response(_NEGATIVE_DAY_BODY, 400)
 
     try:
         session_id = get_session_id()
@@ -439,16 +601,7 @@ def update_progress() -> Tuple[Dict[str, Any], int]:
         thread_id = progress.get("thread_id")
 
         if not thread_id:
-            return (
-                jsonify(
-                    {
-                        "success": False,
-                        "error_code": "NO_THREAD",
-                        "message": "No active thread found to update.",
-                    }
-                ),
-                400,
-            )
+            return json_response(_NO_THREAD_TO_UPDATE_BODY, 400)
 
         progress_manager.save(day, thread_id, session_id)
 
@@ -476,9 +629,9 @@ def update_progress() -> Tuple[Dict[str, Any], int]:
         )
 
 
-@app.route("/api/thread/start", methods=["POST"])
+@api.route("/thread/start", methods=["POST"])
 @require_credentials
-def start_thread() -> Tuple[Dict[str, Any], int]:
+def start_thread() -> ResponseReturnValue:
     """
     Start a new thread with introduction tweet.
 
@@ -490,21 +643,12 @@ def start_thread() -> Tuple[Dict[str, Any], int]:
     Returns:
         JSON response with thread_id and tweet URL on success.
     """
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
     intro_text = data.get("intro_text", "").strip()
 
     # Validate input
     if not intro_text:
-        return (
-            jsonify(
-                {
-                    "success": False,
-                    "error_code": "EMPTY_CONTENT",
-                    "message": "Please enter some text for your thread introduction.",
-                }
-            ),
-            400,
-        )
+        return json_response(_EMPTY_INTRO_BODY, 400)
 
     is_valid, error_msg = validate_tweet_length(intro_text, MAX_TWEET_LENGTH)
     if not is_valid:
@@ -551,9 +695,9 @@ def start_thread() -> Tuple[Dict[str, Any], int]:
         )
 
 
-@app.route("/api/thread/continue", methods=["POST"])
+@api.route("/thread/continue", methods=["POST"])
 @require_credentials
-def continue_thread() -> Tuple[Dict[str, Any], int]:
+def continue_thread() -> ResponseReturnValue:
     """
     Continue an existing thread by thread ID or URL.
 
@@ -566,36 +710,18 @@ def continue_thread() -> Tuple[Dict[str, Any], int]:
     Returns:
         JSON response with thread_id, current_day, and next_day on success.
     """
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
     # Accept both field names for compatibility
     thread_input = data.get("thread_id_or_url") or data.get("thread_id") or ""
     thread_input = thread_input.strip()
 
     if not thread_input:
-        return (
-            jsonify(
-                {
-                    "success": False,
-                    "error_code": "MISSING_THREAD_IDENTIFIER",
-                    "message": "Please provide a thread ID or URL to continue.",
-                }
-            ),
-            400,
-        )
+        return json_response(_MISSING_THREAD_IDENTIFIER_BODY, 400)
 
     # Extract thread ID from URL if provided
     thread_id = extract_thread_id_from_url(thread_input)
     if not thread_id:
-        return (
-            jsonify(
-                {
-                    "success": False,
-                    "error_code": "INVALID_THREAD_URL",
-                    "message": "Invalid thread URL. Please provide a valid X/Twitter thread URL or thread ID.",
-                }
-            ),
-            400,
-        )
+        return json_response(_INVALID_THREAD_URL_BODY, 400)
 
     # Validate thread ID format
     is_valid, error_msg = validate_thread_id(thread_id)
@@ -612,80 +738,74 @@ def continue_thread() -> Tuple[Dict[str, Any], int]:
         )
 
     try:
+        session_id = get_session_id()
         client = TwitterClientManager.create_client(request.twitter_credentials)
 
-        # Get authenticated user to verify ownership
-        me = client.get_me()
-        user_id = str(me.data.id)
-        username = me.data.username
+        # Get the thread tweet to verify it exists and belongs to user; it
+        # doesn't depend on the identity, so it is fetched in the background
+        tweet_future = twitter_executor.submit(
+            client.get_tweet,
+            id=thread_id,
+            tweet_fields=[
+                "author_id",
+                "created_at",
+                "public_metrics",
+                "in_reply_to_user_id",
+            ],
+        )
+
+        # Get authenticated user to verify ownership (cached per session)
+        identity = session_manager.get_identity(session_id)
+        if identity is None:
+            try:
+                me = client.get_me()
+            except Exception:
+                tweet_future.cancel()
+                raise
+            identity = (str(me.data.id), me.data.username)
+            session_manager.set_identity(session_id, *identity)
+        user_id, username = identity
+
+        # Fetch replies in the background while the thread tweet is checked;
+        # the result is only used once ownership has been verified
+        replies_future = twitter_executor.submit(
+            client.search_recent_tweets,
+            query=f"conversation_id:{thread_id} from:{username}",
+            max_results=MAX_REPLIES_TO_FETCH,
+            tweet_fields=["created_at", "text"],
+        )
 
-        # Get the thread tweet to verify it exists and belongs to user
         try:
-            tweet = client.get_tweet(
-                id=thread_id,
-                tweet_fields=[
-                    "author_id",
-                    "created_at",
-                    "public_metrics",
-                    "in_reply_to_user_id",
-                ],
-            )
+            tweet = tweet_future.result()
         except Exception as e:
-            error_str = str(e).lower()
-            if "not found" in error_str or "404" in error_str:
+            replies_future.cancel()
+            if error_matches(e, "NOT_FOUND"):
                 logger.warning(f"Thread not found: {thread_id}")
-                return (
-                    jsonify(
-                        {
-                            "success": False,
-                            "error_code": "THREAD_NOT_FOUND",
-                            "message": "Thread not found. Please check the thread ID or URL.",
-                        }
-                    ),
-                    404,
-                )
+                return json_response(_THREAD_NOT_FOUND_BODY, 404)
             raise
 
         # Verify the thread belongs to the authenticated user
         tweet_author_id = str(tweet.data.author_id)
         if tweet_author_id != user_id:
+            replies_future.cancel()
             logger.warning(
                 f"Thread ownership mismatch: thread={thread_id}, user={user_id}, author={tweet_author_id}"
             )
-            return (
-                jsonify(
-                    {
-                        "success": False,
-                        "error_code": "NOT_OWNER",
-                        "message": "This thread doesn't belong to your account. Please use a thread you created.",
-                    }
-                ),
-                403,
-            )
+            return json_response(_NOT_OWNER_BODY, 403)
 
         # Count replies in the thread to determine current day
         day = 0
         try:
             # Get replies to the thread
-            replies = client.search_recent_tweets(
-                query=f"conversation_id:{thread_id} from:{username}",
-                max_results=MAX_REPLIES_TO_FETCH,
-                tweet_fields=["created_at", "text"],
-            )
+            replies = replies_future.result()
 
             if replies.data:
-                # Extract day numbers from replies
-                day_numbers = []
-                for reply in replies.data:
-                    text = reply.text or ""
-                    day_num = extract_day_from_text(text)
-                    if day_num is not None:
-                        day_numbers.append(day_num)
-
-                # Use the highest day number found
-                if day_numbers:
-                    day = max(day_numbers)
-                    logger.debug(f"Found day numbers: {day_numbers}, using max: {day}")
+                # Use the highest day number found in the replies
+                highest_day = extract_highest_day(reply.text or "" for reply in replies.data)
+
+                if highest_day is not None:
+                    day = highest_day
+                    logger.debug(f"Highest day number found in replies: {day}")
                 else:
                     # If no Day pattern found, count all replies as days
                     day = len(replies.data)
@@ -695,7 +815,6 @@ def continue_thread() -> Tuple[Dict[str, Any], int]:
             # Continue with day 0 if we can't fetch replies
 
         # Save the thread ID and current day
-        session_id = get_session_id()
         progress_manager.save(day, thread_id, session_id)
         logger.info(f"Thread continued: {thread_id}, day={day}")
 
@@ -724,9 +843,9 @@ def continue_thread() -> Tuple[Dict[str, Any], int]:
         )
 
 
-@app.route("/api/solution/post", methods=["POST"])
+@api.route("/solution/post", methods=["POST"])
 @require_credentials
-def post_solution() -> Tuple[Dict[str, Any], int]:
+def post_solution() -> ResponseReturnValue:
     """
     Post a solution to the active thread.
 
@@ -740,34 +859,16 @@ def post_solution() -> Tuple[Dict[str, Any], int]:
     Returns:
         JSON response with tweet details on success.
     """
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
     gist_url = data.get("gist_url", "").strip()
     problem_name = data.get("problem_name", "").strip()
 
     # Validate input
     if not gist_url:
-        return (
-            jsonify(
-                {
-                    "success": False,
-                    "error_code": "MISSING_GIST_URL",
-                    "message": "Please provide a Gist URL for your solution.",
-                }
-            ),
-            400,
-        )
+        return json_response(_MISSING_GIST_URL_BODY, 400)
 
     if not problem_name:
-        return (
-            jsonify(
-                {
-                    "success": False,
-                    "error_code": "MISSING_PROBLEM_NAME",
-                    "message": "Please provide the problem name.",
-                }
-            ),
-            400,
-        )
+        return json_response(_MISSING_PROBLEM_NAME_BODY, 400)
 
     # Load progress
     session_id = get_session_id()
@@ -775,20 +876,11 @@ def post_solution() -> Tuple[Dict[str, Any], int]:
     thread_id = progress.get("thread_id")
 
     if not thread_id:
-        return (
-            jsonify(
-                {
-                    "success": False,
-                    "error_code": "NO_THREAD",
-                    "message": "No active thread found. Please start a new thread first.",
-                }
-            ),
-            400,
-        )
+        return json_response(_NO_THREAD_BODY, 400)
 
     # Build tweet text
     day = progress.get("day", 0) + 1
-    tweet_text = f"Day {day}\n\n{problem_name}\n\n{gist_url}"
+    tweet_text = format_solution_tweet(day, problem_name, gist_url)
 
     # Validate tweet length
     is_valid, error_msg = validate_tweet_length(tweet_text, MAX_TWEET_LENGTH)
@@ -840,9 +932,9 @@ def post_solution() -> Tuple[Dict[str, Any], int]:
         )
 
 
-@app.route("/api/tweet/preview", methods=["POST"])
+@api.route("/tweet/preview", methods=["POST"])
 @require_credentials
-def preview_tweet() -> Tuple[Dict[str, Any], int]:
+def preview_tweet() -> ResponseReturnValue:
     """
     Preview what the tweet will look like without posting.
 
@@ -853,7 +945,7 @@ def preview_tweet() -> Tuple[Dict[str, Any], int]:
     Returns:
         JSON response with tweet preview and validation info.
     """
-    data = request.get_json() or {}
+    data = request.get_json(silent=True, cache=False) or {}
     gist_url = data.get("gist_url", "").strip()
     problem_name = data.get("problem_name", "").strip()
 
@@ -861,7 +953,7 @@ def preview_tweet() -> Tuple[Dict[str, Any], int]:
     progress = progress_manager.load(session_id)
     day = progress.get("day", 0) + 1
 
-    tweet_text = f"Day {day}\n\n{problem_name}\n\n{gist_url}"
+    tweet_text = format_solution_tweet(day, problem_name, gist_url)
     character_count = len(tweet_text)
     is_valid = character_count <= MAX_TWEET_LENGTH
 
@@ -881,9 +973,9 @@ def preview_tweet() -> Tuple[Dict[str, Any], int]:
     )
 
 
-@app.route("/api/user/info", methods=["GET"])
+@api.route("/user/info", methods=["GET"])
 @require_credentials
-def get_user_info() -> Tuple[Dict[str, Any], int]:
+def get_user_info() -> ResponseReturnValue:
     """
     Get authenticated user information from Twitter.
 
@@ -891,8 +983,10 @@ def get_user_info() -> Tuple[Dict[str, Any], int]:
         JSON response with user details (id, username, name, profile_image_url).
     """
     try:
+        session_id = get_session_id()
         client = TwitterClientManager.create_client(request.twitter_credentials)
         user = client.get_me(user_fields=["profile_image_url", "username", "name"])
+        session_manager.set_identity(session_id, str(user.data.id), user.data.username)
 
         profile_image_url = None
         if hasattr(user.data, "profile_image_url") and user.data.profile_image_url:
@@ -922,11 +1016,14 @@ def get_user_info() -> Tuple[Dict[str, Any], int]:
         )
 
 
+app.register_blueprint(api)
+
+
 # ============== ERROR HANDLERS ==============
 
 
 @app.errorhandler(404)
-def not_found(e) -> Tuple[Dict[str, Any], int]:
+def not_found(e) -> Response:
     """
     Handle 404 Not Found errors.
 
@@ -937,20 +1034,30 @@ def not_found(e) -> Tuple[Dict[str, Any], int]:
         JSON error response.
     """
     logger.debug(f"404 error: {request.path}")
-    return (
-        jsonify(
-            {
-                "success": False,
-                "error_code": "NOT_FOUND",
-                "message": "The requested resource was not found.",
-            }
-        ),
-        404,
-    )
+    # Unknown API routes; known routes called with the wrong method still
+    # get the router's 405
+    if request.path == api.url_prefix or request.path.startswith(api.url_prefix + "/"):
+        return json_response(_API_NOT_FOUND_BODY, 404)
+    return json_response(_NOT_FOUND_BODY, 404)
+
+
+@app.errorhandler(413)
+def request_too_large(e) -> Response:
+    """
+    Handle 413 Request Entity Too Large errors.
+
+    Args:
+        e: The error object.
+
+    Returns:
+        JSON error response.
+    """
+    logger.warning(f"413 error: {request.path} ({request.content_length} bytes)")
+    return json_response(_REQUEST_TOO_LARGE_BODY, 413)
 
 
 @app.errorhandler(500)
-def server_error(e) -> Tuple[Dict[str, Any], int]:
+def server_error(e) -> Response:
     """
     Handle 500 Internal Server Error.
 
@@ -961,51 +1068,59 @@ def server_error(e) -> Tuple[Dict[str, Any], int]:
         JSON error response.
     """
     logger.error(f"500 error: {e}")
-    return (
-        jsonify(
-            {
-                "success": False,
-                "error_code": "SERVER_ERROR",
-                "message": "An unexpected error occurred. Please try again later.",
-            }
-        ),
-        500,
-    )
+    return json_response(_SERVER_ERROR_BODY, 500)
 
 
 # ============== STATIC FILE SERVING ==============
 
+
+class NonApiPathConverter(PathConverter):
+    """Path converter that never matches the /api prefix."""
+
+    regex = r"(?!api(?:/|$))[^/].*?"
+
+
+app.url_map.converters["nonapi"] = NonApiPathConverter
+
 if Config.FRONTEND_DIST_PATH.exists():
+    # WhiteNoise serves files from the frontend build before requests reach
+    # Flask; it indexes the directory once at startup. Vite emits
+    # content-hashed names under /assets/, so those can be cached forever.
+    app.wsgi_app = WhiteNoise(
+        app.wsgi_app,
+        root=str(Config.FRONTEND_DIST_PATH),
+        index_file=True,
+        immutable_file_test=r"^/assets/",
+    )
+
+    # The build doesn't change while the process runs, so the SPA shell is
+    # read once instead of being looked up and opened on every route change
+    _INDEX_PATH = Config.FRONTEND_DIST_PATH / "index.html"
+    _INDEX_HTML = _INDEX_PATH.read_bytes() if _INDEX_PATH.is_file() else None
+    _INDEX_ETAG = hashlib.sha1(_INDEX_HTML).hexdigest() if _INDEX_HTML else None
 
     @app.route("/", defaults={"path": ""})
-    @app.route("/<path:path>")
+    # /api and everything below it is left to the blueprint's JSON 404s
+    @app.route("/<nonapi:path>")
     def serve_frontend(path: str):
         """
-        Serve frontend static files.
+        Serve index.html for client-side (SPA) routes.
+
+        Existing static files never reach this route; WhiteNoise serves them.
 
         Args:
             path: Request path.
 
         Returns:
-            Static file or index.html for SPA routing.
+            index.html for SPA routing.
         """
-        # Don't serve frontend for API routes
-        if path.startswith("api/"):
-            return (
-                jsonify(
-                    {
-                        "success": False,
-                        "error_code": "NOT_FOUND",
-                        "message": "The requested API resource was not found.",
-                    }
-                ),
-                404,
-            )
+        if _INDEX_HTML is None:
+            return json_response(_NOT_FOUND_BODY, 404)
 
-        if path and (Config.FRONTEND_DIST_PATH / path).exists():
-            return send_from_directory(str(Config.FRONTEND_DIST_PATH), path)
-        else:
-            return send_from_directory(str(Config.FRONTEND_DIST_PATH), "index.html")
+        response = Response(_INDEX_HTML, mimetype="text/html")
+        response.set_etag(_INDEX_ETAG)
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
 
 
 # ============== APPLICATION ENTRY POINT ==============
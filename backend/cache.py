@@ -0,0 +1,111 @@
+"""
+In-memory caching for ThreadCraft backend.
+
+This module provides a small thread-safe LRU cache with per-entry expiry,
+used for per-session state that is expensive to rebuild (API clients,
+user identities) but must not grow without bound.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+
+    Once maxsize is reached, the least recently used entry is evicted.
+    Expired entries are dropped when they are next looked up, or by
+    purge_expired.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep.
+            ttl: Seconds an entry stays valid after being stored, or None for no expiry.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Optional[V]:
+        """
+        Get a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key.
+            default: Value returned when the key is missing or expired.
+
+        Returns:
+            Cached value, or default.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Optional[V]:
+        """
+        Remove a value from the cache.
+
+        Args:
+            key: Cache key.
+            default: Value returned when the key is missing.
+
+        Returns:
+            Removed value, or default.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return entry[1] if entry is not None else default
+
+    def purge_expired(self) -> int:
+        """
+        Remove all expired entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self._entries.items() if expires_at < now]
+            for key in expired:
+                del self._entries[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -5,9 +5,12 @@ This module handles loading and accessing configuration values from
 environment variables and provides sensible defaults.
 """
 
+import atexit
 import os
+import queue
 import secrets
 import logging
+import logging.handlers
 from pathlib import Path
 from typing import Optional
 
@@ -41,6 +44,7 @@ class Config:
     DATABASE_SALT: str = os.environ.get(
         "DATABASE_SALT", "threadcraft-default-salt-change-in-production"
     )
+    DATABASE_SALT_BYTES: bytes = DATABASE_SALT.encode()
 
     # Logging Configuration
     LOG_LEVEL: str = os.environ.get("LOG_LEVEL", "INFO").upper()
@@ -57,11 +61,34 @@ class Config:
 
     @classmethod
     def setup_logging(cls) -> None:
-        """Configure application logging."""
-        logging.basicConfig(
-            level=getattr(logging, cls.LOG_LEVEL, logging.INFO),
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
+        """
+        Configure application logging.
+
+        Request threads only put records on a queue; a background listener
+        thread formats them and writes them to stderr.
+        """
+        root = logging.getLogger()
+        if root.handlers:
+            # Already configured (like logging.basicConfig, don't override)
+            return
+
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
         )
+
+        log_queue: queue.Queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(
+            log_queue, stream_handler, respect_handler_level=True
+        )
+        listener.start()
+        # Flush queued records on shutdown
+        atexit.register(listener.stop)
+
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.setLevel(getattr(logging, cls.LOG_LEVEL, logging.INFO))
         logger.info(f"Logging configured at {cls.LOG_LEVEL} level")
 
@@ -5,27 +5,48 @@ This module centralizes all constant values used throughout the application,
 making them easier to maintain and update.
 """
 
-from typing import Final
+import re
+from types import MappingProxyType
+from typing import Any, Dict, Final, Mapping
 
 # Tweet/Content Limits
 MAX_TWEET_LENGTH: Final[int] = 280
 MIN_TWEET_LENGTH: Final[int] = 1
+MAX_REQUEST_BODY_BYTES: Final[int] = 8 * 1024
 
 # Session Configuration
 SESSION_EXPIRY_HOURS: Final[int] = 24
 SESSION_ID_LENGTH: Final[int] = 32
+MAX_CACHED_SESSIONS: Final[int] = 256
+SESSION_CACHE_SIZE: Final[int] = 10000
+SESSION_CACHE_SECONDS: Final[int] = 30
+SESSION_CACHE_SWEEP_SECONDS: Final[int] = 60
+CREDENTIAL_VALIDATION_CACHE_SIZE: Final[int] = 1024
+CREDENTIAL_VALIDATION_CACHE_SECONDS: Final[int] = 300
 
 # Thread Detection
 DAY_PATTERN_REGEX: Final[str] = r'Day\s+(\d+)'
+DAY_PATTERN: Final[re.Pattern] = re.compile(DAY_PATTERN_REGEX, re.IGNORECASE)
 MAX_REPLIES_TO_FETCH: Final[int] = 100
+TWITTER_API_WORKERS: Final[int] = 8
+TWITTER_HTTP_POOL_SIZE: Final[int] = 64
 
 # Thread URL Patterns
 X_COM_DOMAIN: Final[str] = "x.com"
 TWITTER_COM_DOMAIN: Final[str] = "twitter.com"
 THREAD_URL_STATUS_PATTERN: Final[str] = r'/status/(\d+)'
+THREAD_URL_STATUS_RE: Final[re.Pattern] = re.compile(THREAD_URL_STATUS_PATTERN)
 
 # Progress File Structure
-DEFAULT_PROGRESS: Final[dict] = {"day": 0, "thread_id": None}
+DEFAULT_PROGRESS: Final[Mapping[str, Any]] = MappingProxyType({"day": 0, "thread_id": None})
+PROGRESS_FLUSH_DELAY_SECONDS: Final[float] = 0.5
+PROGRESS_FLUSH_RETRY_SECONDS: Final[float] = 5.0
+
+
+def default_progress() -> Dict[str, Any]:
+    """Return a new, mutable copy of DEFAULT_PROGRESS (a dict literal is cheaper than .copy())."""
+    return {"day": 0, "thread_id": None}
+
 
 # Required Credential Fields
 REQUIRED_CREDENTIAL_FIELDS: Final[list[str]] = [
@@ -35,4 +56,5 @@ REQUIRED_CREDENTIAL_FIELDS: Final[list[str]] = [
     "access_token_secret",
     "bearer_token",
 ]
+REQUIRED_CREDENTIAL_FIELDS_SET: Final[frozenset[str]] = frozenset(REQUIRED_CREDENTIAL_FIELDS)
 
@@ -8,13 +8,38 @@ encrypted thread progress data using Supabase as the backend.
 import hashlib
 import base64
 import logging
-from typing import Optional, Dict, Any
-from cryptography.fernet import Fernet
+from typing import Optional, Dict, Any, Tuple
 
+from cache import TTLCache
 from config import Config
+from constants import MAX_CACHED_SESSIONS, SESSION_EXPIRY_HOURS, default_progress
+from serialization import dumps, loads
 
 logger = logging.getLogger(__name__)
 
+# Prefer the Rust-backed rfernet binding (same token format, several times faster).
+# InvalidToken is the binding's error for a token the key can't decrypt.
+try:
+    from rfernet import DecryptionError as InvalidToken
+    from rfernet import Fernet as _RFernet
+
+    class Fernet:
+        """Adapter exposing rfernet through the cryptography.fernet bytes API."""
+
+        __slots__ = ("_fernet",)
+
+        def __init__(self, key: bytes):
+            self._fernet = _RFernet(key.decode())
+
+        def encrypt(self, data: bytes) -> bytes:
+            return self._fernet.encrypt(data).encode()
+
+        def decrypt(self, token: bytes) -> bytes:
+            return self._fernet.decrypt(token.decode())
+
+except ImportError:
+    from cryptography.fernet import Fernet, InvalidToken
+
 # Try importing Supabase (may not be available)
 try:
     from supabase import create_client, Client
@@ -25,14 +50,106 @@ except ImportError:
     create_client = None  # type: ignore
 
 
+class _SessionFernet:
+    """
+    Fernet cipher for one session, with the legacy key as a fallback.
+
+    New data is encrypted with a key derived by keyed BLAKE2b (session ID,
+    keyed by the database salt). Data written before that change was
+    encrypted with an unsalted SHA-256 of the session ID; it stays readable,
+    and load_user_data re-encrypts it with the current key when it is read.
+    """
+
+    __slots__ = ("_current", "_legacy")
+
+    def __init__(self, current: Fernet, legacy: Fernet):
+        self._current = current
+        self._legacy = legacy
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self._current.encrypt(data)
+
+    def decrypt(self, token: bytes) -> bytes:
+        return self.decrypt_versioned(token)[0]
+
+    def decrypt_versioned(self, token: bytes) -> Tuple[bytes, bool]:
+        """
+        Decrypt a token, reporting whether it used the legacy key.
+
+        Args:
+            token: Fernet token.
+
+        Returns:
+            Tuple of (plaintext, used_legacy_key).
+
+        Raises:
+            InvalidToken: If neither key can decrypt the token.
+        """
+        try:
+            return self._current.decrypt(token), False
+        except InvalidToken:
+            return self._legacy.decrypt(token), True
+
+
+# Derived Fernet instances per session; evicted when the session's data is deleted
+_fernet_cache: TTLCache[_SessionFernet] = TTLCache(
+    maxsize=MAX_CACHED_SESSIONS, ttl=SESSION_EXPIRY_HOURS * 3600
+)
+
+# Row key (salted SHA-256 of the session ID) per session
+_user_hash_cache: TTLCache[str] = TTLCache(
+    maxsize=MAX_CACHED_SESSIONS, ttl=SESSION_EXPIRY_HOURS * 3600
+)
+
+
+def purge_expired_caches() -> int:
+    """
+    Remove expired entries from the per-session caches.
+
+    Returns:
+        Number of entries removed.
+    """
+    return _fernet_cache.purge_expired() + _user_hash_cache.purge_expired()
+
+
+def _fernet_for(session_id: str) -> _SessionFernet:
+    """
+    Get the Fernet cipher for a session, deriving it on first use.
+
+    The keys are a pure function of the session ID (and salt), so key
+    derivation and Fernet setup are paid once per session rather than on
+    every encrypt/decrypt.
+
+    Args:
+        session_id: Session ID used to generate the encryption key.
+
+    Returns:
+        Cipher keyed for the session.
+    """
+    fernet = _fernet_cache.get(session_id)
+    if fernet is None:
+        session_bytes = session_id.encode()
+        key = hashlib.blake2b(
+            session_bytes, digest_size=32, key=Config.DATABASE_SALT_BYTES[:64]
+        ).digest()
+        legacy_key = hashlib.sha256(session_bytes).digest()
+        fernet = _SessionFernet(
+            Fernet(base64.urlsafe_b64encode(key)),
+            Fernet(base64.urlsafe_b64encode(legacy_key)),
+        )
+        _fernet_cache.set(session_id, fernet)
+    return fernet
+
+
 class DatabaseManager:
     """Manages database operations for thread progress storage."""
 
+    __slots__ = ("supabase",)
+
     def __init__(self):
         """Initialize database connection and encryption setup."""
         self.supabase: Optional[Client] = None
         self._initialize_supabase()
-        self._salt = Config.DATABASE_SALT.encode()
 
     def _initialize_supabase(self) -> None:
         """
@@ -67,13 +184,14 @@ class DatabaseManager:
                 logger.error(
                     "Supabase dependency version conflict detected. "
                     "This is usually fixed by updating supabase to version 2.8.0 or higher. "
-                    f"Error: {e}"
+                    "Error: %s",
+                    e,
                 )
             else:
-                logger.error(f"Failed to initialize Supabase client (TypeError): {e}")
+                logger.error("Failed to initialize Supabase client (TypeError): %s", e)
                 logger.exception("Full error traceback:")
         except Exception as e:
-            logger.error(f"Failed to initialize Supabase client: {e}")
+            logger.error("Failed to initialize Supabase client: %s", e)
             logger.exception("Full error traceback:")
             # Don't raise - allow fallback to file storage
 
@@ -87,17 +205,21 @@ class DatabaseManager:
         Returns:
             Hexadecimal string of the SHA-256 hash (64 characters).
         """
-        combined = (session_id + Config.DATABASE_SALT).encode()
-        hash_obj = hashlib.sha256(combined)
-        return hash_obj.hexdigest()
-
-    def _encrypt_thread_id(self, thread_id: Optional[str], session_id: str) -> Optional[str]:
+        user_hash = _user_hash_cache.get(session_id)
+        if user_hash is None:
+            hash_obj = hashlib.sha256(session_id.encode())
+            hash_obj.update(Config.DATABASE_SALT_BYTES)
+            user_hash = hash_obj.hexdigest()
+            _user_hash_cache.set(session_id, user_hash)
+        return user_hash
+
+    def _encrypt_thread_id(self, thread_id: Optional[str], fernet: "_SessionFernet") -> Optional[str]:
         """
         Encrypt thread ID using Fernet encryption.
 
         Args:
             thread_id: Thread ID/URL to encrypt.
-            session_id: Session ID used to generate encryption key.
+            fernet: Session cipher (see _fernet_for).
 
         Returns:
             Base64-encoded encrypted string, or None if thread_id is None.
@@ -106,50 +228,43 @@ class DatabaseManager:
             return None
 
         try:
-            # Generate encryption key from session ID (same method as session_manager)
-            key = hashlib.sha256(session_id.encode()).digest()
-            fernet_key = base64.urlsafe_b64encode(key)
-            fernet = Fernet(fernet_key)
-
             encrypted = fernet.encrypt(thread_id.encode())
             return encrypted.decode()
         except Exception as e:
-            logger.error(f"Failed to encrypt thread_id: {e}")
+            logger.error("Failed to encrypt thread_id: %s", e)
             raise
 
-    def _decrypt_thread_id(self, encrypted_thread_id: Optional[str], session_id: str) -> Optional[str]:
+    def _decrypt_thread_id(
+        self, encrypted_thread_id: Optional[str], fernet: "_SessionFernet"
+    ) -> Tuple[Optional[str], bool]:
         """
         Decrypt thread ID using Fernet decryption.
 
         Args:
             encrypted_thread_id: Encrypted thread ID string.
-            session_id: Session ID used to generate decryption key.
+            fernet: Session cipher (see _fernet_for).
 
         Returns:
-            Decrypted thread ID/URL, or None if encrypted_thread_id is None.
+            Tuple of (decrypted thread ID/URL or None if encrypted_thread_id
+            is None, whether it was encrypted with the legacy key).
         """
         if encrypted_thread_id is None:
-            return None
+            return None, False
 
         try:
-            # Generate decryption key from session ID (same method as session_manager)
-            key = hashlib.sha256(session_id.encode()).digest()
-            fernet_key = base64.urlsafe_b64encode(key)
-            fernet = Fernet(fernet_key)
-
-            decrypted = fernet.decrypt(encrypted_thread_id.encode())
-            return decrypted.decode()
+            decrypted, legacy = fernet.decrypt_versioned(encrypted_thread_id.encode())
+            return decrypted.decode(), legacy
         except Exception as e:
-            logger.error(f"Failed to decrypt thread_id: {e}")
+            logger.error("Failed to decrypt thread_id: %s", e)
             raise
 
-    def _encrypt_credentials(self, credentials: Dict[str, str], session_id: str) -> str:
+    def _encrypt_credentials(self, credentials: Dict[str, str], fernet: "_SessionFernet") -> str:
         """
         Encrypt credentials using Fernet encryption.
 
         Args:
             credentials: Dictionary containing API credentials.
-            session_id: Session ID used to generate encryption key.
+            fernet: Session cipher (see _fernet_for).
 
         Returns:
             Base64-encoded encrypted string.
@@ -158,41 +273,35 @@ class DatabaseManager:
             Exception: If encryption fails.
         """
         try:
-            key = hashlib.sha256(session_id.encode()).digest()
-            fernet_key = base64.urlsafe_b64encode(key)
-            fernet = Fernet(fernet_key)
-
-            import json
-            encrypted = fernet.encrypt(json.dumps(credentials).encode())
+            # Compact JSON bytes: fewer plaintext bytes to encrypt and authenticate
+            encrypted = fernet.encrypt(dumps(credentials))
             return encrypted.decode()
         except Exception as e:
-            logger.error(f"Failed to encrypt credentials: {e}")
+            logger.error("Failed to encrypt credentials: %s", e)
             raise
 
-    def _decrypt_credentials(self, encrypted_credentials: str, session_id: str) -> Dict[str, str]:
+    def _decrypt_credentials(
+        self, encrypted_credentials: str, fernet: "_SessionFernet"
+    ) -> Tuple[Dict[str, str], bool]:
         """
         Decrypt credentials using Fernet decryption.
 
         Args:
             encrypted_credentials: Encrypted credentials string.
-            session_id: Session ID used to generate decryption key.
+            fernet: Session cipher (see _fernet_for).
 
         Returns:
-            Decrypted credentials dictionary.
+            Tuple of (decrypted credentials dictionary, whether they were
+            encrypted with the legacy key).
 
         Raises:
             Exception: If decryption fails.
         """
         try:
-            key = hashlib.sha256(session_id.encode()).digest()
-            fernet_key = base64.urlsafe_b64encode(key)
-            fernet = Fernet(fernet_key)
-
-            decrypted = fernet.decrypt(encrypted_credentials.encode())
-            import json
-            return json.loads(decrypted.decode())
+            decrypted, legacy = fernet.decrypt_versioned(encrypted_credentials.encode())
+            return loads(decrypted), legacy
         except Exception as e:
-            logger.error(f"Failed to decrypt credentials: {e}")
+            logger.error("Failed to decrypt credentials: %s", e)
             raise
 
     def save_user_data(
@@ -220,7 +329,8 @@ class DatabaseManager:
 
         try:
             user_hash = self._hash_user_identifier(session_id)
-            encrypted_credentials = self._encrypt_credentials(credentials, session_id)
+            fernet = _fernet_for(session_id)
+            encrypted_credentials = self._encrypt_credentials(credentials, fernet)
 
             update_data = {
                 "user_identifier_hash": user_hash,
@@ -231,7 +341,7 @@ class DatabaseManager:
             if day is not None:
                 update_data["current_day"] = day
             if thread_id is not None:
-                update_data["encrypted_thread_id"] = self._encrypt_thread_id(thread_id, session_id)
+                update_data["encrypted_thread_id"] = self._encrypt_thread_id(thread_id, fernet)
 
             # Upsert: Update if exists, insert if new
             response = (
@@ -240,10 +350,10 @@ class DatabaseManager:
                 .execute()
             )
 
-            logger.info(f"User data saved to database: user_hash={user_hash[:8]}...")
+            logger.info("User data saved to database: user_hash=%s...", user_hash[:8])
             return True
         except Exception as e:
-            logger.error(f"Failed to save user data to database: {e}")
+            logger.error("Failed to save user data to database: %s", e)
             return False
 
     def load_user_data(self, session_id: str) -> Optional[Dict[str, Any]]:
@@ -266,7 +376,7 @@ class DatabaseManager:
 
             response = (
                 self.supabase.table("threadcraft_users")
-                .select("*")
+                .select("encrypted_credentials,encrypted_thread_id,current_day")
                 .eq("user_identifier_hash", user_hash)
                 .execute()
             )
@@ -279,20 +389,76 @@ class DatabaseManager:
             encrypted_credentials = row.get("encrypted_credentials")
             encrypted_thread_id = row.get("encrypted_thread_id")
 
-            credentials = self._decrypt_credentials(encrypted_credentials, session_id)
-            thread_id = self._decrypt_thread_id(encrypted_thread_id, session_id)
+            fernet = _fernet_for(session_id)
+            credentials, credentials_legacy = self._decrypt_credentials(
+                encrypted_credentials, fernet
+            )
+            thread_id, thread_id_legacy = self._decrypt_thread_id(encrypted_thread_id, fernet)
             day = row.get("current_day", 0)
 
-            logger.debug(f"Loaded user data from database: user_hash={user_hash[:8]}...")
+            if credentials_legacy or thread_id_legacy:
+                self._migrate_row(
+                    user_hash,
+                    fernet,
+                    (encrypted_credentials, credentials) if credentials_legacy else None,
+                    (encrypted_thread_id, thread_id) if thread_id_legacy else None,
+                )
+
+            logger.debug("Loaded user data from database: user_hash=%s...", user_hash[:8])
             return {
                 "credentials": credentials,
                 "day": day,
                 "thread_id": thread_id,
             }
         except Exception as e:
-            logger.error(f"Failed to load user data from database: {e}")
+            logger.error("Failed to load user data from database: %s", e)
             return None
 
+    def _migrate_row(
+        self,
+        user_hash: str,
+        fernet: "_SessionFernet",
+        credentials: Optional[Tuple[str, Dict[str, str]]],
+        thread_id: Optional[Tuple[str, str]],
+    ) -> None:
+        """
+        Re-encrypt a row's legacy-key fields with the current key.
+
+        Each field is only replaced if it still holds the ciphertext that was
+        read, so a concurrent save is never overwritten with older data.
+        Failures are logged; the row stays readable with the legacy key.
+
+        Args:
+            user_hash: Row key (see _hash_user_identifier).
+            fernet: Session cipher (see _fernet_for).
+            credentials: (old ciphertext, credentials) if the credentials
+                need migrating, else None.
+            thread_id: (old ciphertext, thread ID) if the thread ID needs
+                migrating, else None.
+        """
+        try:
+            update_data = {}
+            if credentials is not None:
+                update_data["encrypted_credentials"] = self._encrypt_credentials(
+                    credentials[1], fernet
+                )
+            if thread_id is not None:
+                update_data["encrypted_thread_id"] = self._encrypt_thread_id(thread_id[1], fernet)
+
+            query = (
+                self.supabase.table("threadcraft_users")
+                .update(update_data)
+                .eq("user_identifier_hash", user_hash)
+            )
+            if credentials is not None:
+                query = query.eq("encrypted_credentials", credentials[0])
+            if thread_id is not None:
+                query = query.eq("encrypted_thread_id", thread_id[0])
+            query.execute()
+            logger.info("Re-encrypted legacy-key user data: user_hash=%s...", user_hash[:8])
+        except Exception as e:
+            logger.warning("Failed to re-encrypt legacy-key user data: %s", e)
+
     def delete_user_data(self, session_id: str) -> bool:
         """
         Delete all user data from database (credentials and progress).
@@ -317,10 +483,12 @@ class DatabaseManager:
                 .execute()
             )
 
-            logger.info(f"User data deleted from database: user_hash={user_hash[:8]}...")
+            _fernet_cache.pop(session_id)
+            _user_hash_cache.pop(session_id)
+            logger.info("User data deleted from database: user_hash=%s...", user_hash[:8])
             return True
         except Exception as e:
-            logger.error(f"Failed to delete user data from database: {e}")
+            logger.error("Failed to delete user data from database: %s", e)
             return False
 
     def save_progress(
@@ -344,22 +512,10 @@ class DatabaseManager:
 
         try:
             user_hash = self._hash_user_identifier(session_id)
+            encrypted_thread_id = self._encrypt_thread_id(thread_id, _fernet_for(session_id))
 
-            # First check if user exists
-            response = (
-                self.supabase.table("threadcraft_users")
-                .select("encrypted_credentials")
-                .eq("user_identifier_hash", user_hash)
-                .execute()
-            )
-
-            if not response.data:
-                logger.warning("Cannot save progress: user credentials not found in database")
-                return False
-
-            encrypted_thread_id = self._encrypt_thread_id(thread_id, session_id)
-
-            # Update only progress fields
+            # Update only progress fields; the updated rows are returned, so
+            # an empty result means the user doesn't exist
             response = (
                 self.supabase.table("threadcraft_users")
                 .update(
@@ -372,10 +528,14 @@ class DatabaseManager:
                 .execute()
             )
 
-            logger.info(f"Progress saved to database: day={day}, user_hash={user_hash[:8]}...")
+            if not response.data:
+                logger.warning("Cannot save progress: user credentials not found in database")
+                return False
+
+            logger.info("Progress saved to database: day=%s, user_hash=%s...", day, user_hash[:8])
             return True
         except Exception as e:
-            logger.error(f"Failed to save progress to database: {e}")
+            logger.error("Failed to save progress to database: %s", e)
             return False
 
     def load_progress(self, session_id: str) -> Dict[str, Any]:
@@ -395,7 +555,7 @@ class DatabaseManager:
                 "day": user_data.get("day", 0),
                 "thread_id": user_data.get("thread_id"),
             }
-        return {"day": 0, "thread_id": None}
+        return default_progress()
 
     def reset_progress(self, session_id: str) -> bool:
         """
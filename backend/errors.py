@@ -5,7 +5,8 @@ This module defines custom exceptions and provides utilities for converting
 technical errors into user-friendly messages.
 """
 
-from typing import Tuple
+import re
+from typing import Dict, Optional, Tuple
 
 
 class ThreadCraftError(Exception):
@@ -38,6 +39,101 @@ class TwitterAPIError(ThreadCraftError):
     pass
 
 
+# Error categories in priority order: (error_code, keywords, user_message).
+# Earlier categories win when a message contains keywords from several.
+_ERROR_CATEGORIES: Tuple[Tuple[str, Tuple[str, ...], str], ...] = (
+    (
+        "AUTHENTICATION_FAILED",
+        ("unauthorized", "401"),
+        "Your X/Twitter API credentials appear to be invalid. Please check your API keys in settings.",
+    ),
+    (
+        "PERMISSION_DENIED",
+        ("forbidden", "403"),
+        "Your X/Twitter account does not have permission for this action. "
+        "Please check your app permissions on the Twitter Developer Portal.",
+    ),
+    (
+        "RATE_LIMITED",
+        ("rate limit", "429"),
+        "You've hit the X/Twitter rate limit. Please wait a few minutes before trying again.",
+    ),
+    (
+        "DUPLICATE_TWEET",
+        ("duplicate",),
+        "This tweet appears to be a duplicate. Please modify your content and try again.",
+    ),
+    (
+        "TWEET_TOO_LONG",
+        ("too long", "character"),
+        "Your tweet is too long. Please shorten it to 280 characters or less.",
+    ),
+    (
+        "CONNECTION_ERROR",
+        ("connection", "timeout", "network"),
+        "Unable to connect to X/Twitter. Please check your internet connection and try again.",
+    ),
+    (
+        "NOT_FOUND",
+        ("not found", "404"),
+        "The requested resource was not found. Please check your input and try again.",
+    ),
+)
+
+_UNKNOWN_ERROR: Tuple[str, str] = (
+    "UNKNOWN_ERROR",
+    "Something went wrong while processing your request. Please try again or check your settings.",
+)
+
+# Error code -> pattern matching only that category's keywords (dicts keep
+# insertion order, so iterating follows the category priority)
+_CATEGORY_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    error_code: re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+    for error_code, keywords, _ in _ERROR_CATEGORIES
+}
+
+
+def classify_error(error: Exception) -> Optional[str]:
+    """
+    Get the error code of the highest-priority category an error matches.
+
+    Args:
+        error: The exception that occurred.
+
+    Returns:
+        Error code (e.g., "AUTHENTICATION_FAILED"), or None if no category matches.
+    """
+    # Searched per category: in one combined scan, a lower-priority match
+    # could consume characters a higher-priority keyword needs ("40401")
+    error_str = str(error)
+    for error_code, pattern in _CATEGORY_PATTERNS.items():
+        if pattern.search(error_str):
+            return error_code
+    return None
+
+
+def error_matches(error: Exception, error_code: str) -> bool:
+    """
+    Check whether an error message contains any keyword of a category.
+
+    Unlike classify_error, other (higher-priority) categories are ignored.
+
+    Args:
+        error: The exception that occurred.
+        error_code: Category error code (e.g., "NOT_FOUND").
+
+    Returns:
+        True if the message contains one of the category's keywords.
+    """
+    return _CATEGORY_PATTERNS[error_code].search(str(error)) is not None
+
+
+# Error code -> user message
+_ERROR_MESSAGES: Dict[str, str] = {
+    error_code: user_message for error_code, _, user_message in _ERROR_CATEGORIES
+}
+
+
 def friendly_error_message(error: Exception) -> Tuple[str, str]:
     """
     Convert technical errors to user-friendly error codes and messages.
@@ -53,61 +149,8 @@ def friendly_error_message(error: Exception) -> Tuple[str, str]:
         - error_code: Machine-readable error code (e.g., "AUTHENTICATION_FAILED")
         - user_message: Human-readable error message for display to users.
     """
-    error_str = str(error).lower()
-
-    # Authentication errors
-    if "unauthorized" in error_str or "401" in error_str:
-        return (
-            "AUTHENTICATION_FAILED",
-            "Your X/Twitter API credentials appear to be invalid. Please check your API keys in settings.",
-        )
-
-    # Authorization errors
-    if "forbidden" in error_str or "403" in error_str:
-        return (
-            "PERMISSION_DENIED",
-            "Your X/Twitter account does not have permission for this action. "
-            "Please check your app permissions on the Twitter Developer Portal.",
-        )
-
-    # Rate limiting
-    if "rate limit" in error_str or "429" in error_str:
-        return (
-            "RATE_LIMITED",
-            "You've hit the X/Twitter rate limit. Please wait a few minutes before trying again.",
-        )
-
-    # Duplicate content
-    if "duplicate" in error_str:
-        return (
-            "DUPLICATE_TWEET",
-            "This tweet appears to be a duplicate. Please modify your content and try again.",
-        )
-
-    # Length validation
-    if "too long" in error_str or "character" in error_str:
-        return (
-            "TWEET_TOO_LONG",
-            "Your tweet is too long. Please shorten it to 280 characters or less.",
-        )
-
-    # Network/connection errors
-    if "connection" in error_str or "timeout" in error_str or "network" in error_str:
-        return (
-            "CONNECTION_ERROR",
-            "Unable to connect to X/Twitter. Please check your internet connection and try again.",
-        )
-
-    # Not found errors
-    if "not found" in error_str or "404" in error_str:
-        return (
-            "NOT_FOUND",
-            "The requested resource was not found. Please check your input and try again.",
-        )
-
-    # Default/unknown error
-    return (
-        "UNKNOWN_ERROR",
-        "Something went wrong while processing your request. Please try again or check your settings.",
-    )
+    error_code = classify_error(error)
+    if error_code is None:
+        return _UNKNOWN_ERROR
 
+    return error_code, _ERROR_MESSAGES[error_code]
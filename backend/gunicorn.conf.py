@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration for ThreadCraft backend.
+
+Requests spend most of their time waiting on the X/Twitter and Supabase
+APIs, so workers multiplex many requests at once: with gevent installed
+each worker runs requests as greenlets, otherwise it falls back to a
+thread pool (gthread). Values can be overridden through environment
+variables.
+"""
+
+import importlib.util
+import os
+
+# The gevent worker monkey-patches the standard library itself before the
+# app is imported, so tweepy/requests calls yield while waiting on the network
+_default_worker_class = "gevent" if importlib.util.find_spec("gevent") else "gthread"
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", _default_worker_class)
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", 1000))
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
@@ -5,13 +5,23 @@ This module handles loading and saving thread progress to persistent storage.
 Supports both Supabase database (with encryption) and JSON file fallback.
 """
 
-import json
+import atexit
 import logging
+import os
+import tempfile
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-from constants import DEFAULT_PROGRESS
+from constants import (
+    PROGRESS_FLUSH_DELAY_SECONDS,
+    PROGRESS_FLUSH_RETRY_SECONDS,
+    default_progress,
+)
 from config import Config
+from serialization import dumps, loads
+
+from session_manager import session_manager
 
 # Import database manager (may not be available if Supabase not configured)
 try:
@@ -25,6 +35,15 @@ logger = logging.getLogger(__name__)
 class ProgressManager:
     """Manages thread progress persistence with database and file fallback."""
 
+    __slots__ = (
+        "progress_file",
+        "_file_progress",
+        "_file_mtime",
+        "_file_lock",
+        "_dirty",
+        "_flush_timer",
+    )
+
     def __init__(self, progress_file: Path):
         """
         Initialize progress manager.
@@ -33,14 +52,24 @@ class ProgressManager:
             progress_file: Path to the JSON file where progress is stored (fallback).
         """
         self.progress_file = progress_file
+        # In-memory copy of the progress file, re-read when the file's mtime
+        # changes (e.g. another worker process wrote it)
+        self._file_progress: Optional[Dict[str, Any]] = None
+        self._file_mtime: Optional[int] = None
+        self._file_lock = threading.Lock()
+        # Saves update the in-memory copy; the file is written shortly after,
+        # so a burst of saves costs a single write
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
         self._ensure_progress_file()
+        atexit.register(self.flush)
 
     def _ensure_progress_file(self) -> None:
         """Ensure the progress file directory exists."""
         try:
             self.progress_file.parent.mkdir(parents=True, exist_ok=True)
         except Exception as e:
-            logger.error(f"Failed to create progress file directory: {e}")
+            logger.error("Failed to create progress file directory: %s", e)
             raise
 
     def load(self, session_id: Optional[str] = None) -> Dict[str, Any]:
@@ -58,35 +87,73 @@ class ProgressManager:
         # Try database first if session_id provided and database available
         if session_id and database_manager and database_manager.is_available():
             try:
-                progress = database_manager.load_progress(session_id)
+                # Shares the read made when the request's session was checked
+                user_data = session_manager.load_for_request(session_id)
+                if user_data:
+                    progress = {
+                        "day": user_data.get("day", 0),
+                        "thread_id": user_data.get("thread_id"),
+                    }
+                else:
+                    progress = default_progress()
                 logger.debug(
-                    f"Loaded progress from database: day={progress.get('day')}, "
-                    f"thread_id={progress.get('thread_id')}"
+                    "Loaded progress from database: day=%s, thread_id=%s",
+                    progress.get("day"),
+                    progress.get("thread_id"),
                 )
                 return progress
             except Exception as e:
-                logger.warning(f"Failed to load from database, falling back to file: {e}")
+                logger.warning("Failed to load from database, falling back to file: %s", e)
 
-        # Fallback to JSON file
+        # Fallback to JSON file (cached in memory until the file changes;
+        # pending unflushed saves are newer than the file)
+        with self._file_lock:
+            if not self._dirty:
+                mtime = self._progress_file_mtime()
+                if self._file_progress is None or mtime != self._file_mtime:
+                    self._file_progress = self._read_progress_file()
+                    self._file_mtime = mtime
+            return dict(self._file_progress)
+
+    def _progress_file_mtime(self) -> Optional[int]:
+        """
+        Get the progress file's modification time.
+
+        Returns:
+            Modification time in nanoseconds, or None if the file can't be stat'ed.
+        """
+        try:
+            return os.stat(self.progress_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _read_progress_file(self) -> Dict[str, Any]:
+        """
+        Read progress from the JSON file on disk.
+
+        Returns:
+            Progress dictionary, or default progress if the file is missing or invalid.
+        """
         try:
             if not self.progress_file.exists():
                 logger.debug("Progress file does not exist, returning defaults")
-                return DEFAULT_PROGRESS.copy()
+                return default_progress()
 
-            with open(self.progress_file, "r", encoding="utf-8") as f:
-                progress = json.load(f)
+            with open(self.progress_file, "rb") as f:
+                progress = loads(f.read())
                 logger.debug(
-                    f"Loaded progress from file: day={progress.get('day')}, "
-                    f"thread_id={progress.get('thread_id')}"
+                    "Loaded progress from file: day=%s, thread_id=%s",
+                    progress.get("day"),
+                    progress.get("thread_id"),
                 )
                 return progress
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in progress file: {e}")
-            return DEFAULT_PROGRESS.copy()
+        except ValueError as e:
+            logger.error("Invalid JSON in progress file: %s", e)
+            return default_progress()
         except Exception as e:
-            logger.error(f"Failed to load progress: {e}")
-            return DEFAULT_PROGRESS.copy()
+            logger.error("Failed to load progress: %s", e)
+            return default_progress()
 
     def save(self, day: int, thread_id: Optional[str], session_id: Optional[str] = None) -> None:
         """
@@ -98,37 +165,89 @@ class ProgressManager:
             session_id: Optional session ID for database storage. If provided and
                        database is available, will save to database instead of file.
 
-        Raises:
-            IOError: If file writing fails and database save also fails.
+        File writes are deferred by PROGRESS_FLUSH_DELAY_SECONDS (see flush);
+        loads in this process see the new progress immediately. Write
+        failures are logged by flush rather than raised here.
         """
         # Try database first if session_id provided and database available
         if session_id and database_manager and database_manager.is_available():
             try:
                 success = database_manager.save_progress(session_id, day, thread_id)
+                session_manager.discard_request_data(session_id)
                 if success:
                     logger.info(
-                        f"Saved progress to database: day={day}, thread_id={thread_id}"
+                        "Saved progress to database: day=%s, thread_id=%s", day, thread_id
                     )
                     return
                 else:
                     logger.warning("Database save returned False, falling back to file")
             except Exception as e:
-                logger.warning(f"Failed to save to database, falling back to file: {e}")
+                logger.warning("Failed to save to database, falling back to file: %s", e)
 
         # Fallback to JSON file
-        try:
-            progress_data = {
+        with self._file_lock:
+            self._file_progress = {
                 "day": day,
                 "thread_id": thread_id,
             }
+            self._dirty = True
+            if self._flush_timer is None:
+                self._start_flush_timer(PROGRESS_FLUSH_DELAY_SECONDS)
 
-            with open(self.progress_file, "w", encoding="utf-8") as f:
-                json.dump(progress_data, f, indent=2)
+        logger.info("Saved progress to file: day=%s, thread_id=%s", day, thread_id)
 
-            logger.info(f"Saved progress to file: day={day}, thread_id={thread_id}")
-        except Exception as e:
-            logger.error(f"Failed to save progress: {e}")
-            raise
+    def _start_flush_timer(self, delay: float) -> None:
+        """
+        Schedule flush on a daemon timer. Must be called with _file_lock held.
+
+        Args:
+            delay: Seconds to wait before flushing.
+        """
+        self._flush_timer = threading.Timer(delay, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def flush(self) -> None:
+        """
+        Write pending progress to the JSON file.
+
+        Called by the debounce timer after a save, and at interpreter exit.
+        A failed write is retried after PROGRESS_FLUSH_RETRY_SECONDS.
+        """
+        with self._file_lock:
+            self._flush_timer = None
+            if not self._dirty:
+                return
+            progress_data = self._file_progress
+            self._dirty = False
+
+            # Write to a uniquely named temp file (other worker processes may
+            # flush at the same time) and rename so readers never see a
+            # partial file; fsync first so a crash can't leave it empty
+            tmp_name = None
+            try:
+                with tempfile.NamedTemporaryFile(
+                    dir=self.progress_file.parent,
+                    prefix=self.progress_file.name + ".",
+                    suffix=".tmp",
+                    delete=False,
+                ) as f:
+                    tmp_name = f.name
+                    f.write(dumps(progress_data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_name, self.progress_file)
+                self._file_mtime = self._progress_file_mtime()
+            except Exception as e:
+                logger.error("Failed to write progress file: %s", e)
+                # Keep the progress pending and try again shortly
+                self._dirty = True
+                self._start_flush_timer(PROGRESS_FLUSH_RETRY_SECONDS)
+                if tmp_name is not None:
+                    try:
+                        os.unlink(tmp_name)
+                    except OSError:
+                        pass
 
     def reset(self, session_id: Optional[str] = None) -> None:
         """
@@ -138,8 +257,7 @@ class ProgressManager:
             session_id: Optional session ID for database reset. If provided and
                        database is available, will reset in database instead of file.
 
-        Raises:
-            IOError: If file writing fails and database reset also fails.
+        Like save, a failed file write is logged when it is flushed, not raised.
         """
         self.save(0, None, session_id)
         logger.info("Progress reset to defaults")
@@ -0,0 +1,94 @@
+"""
+JSON serialization for ThreadCraft backend.
+
+This module provides the JSON encode/decode helpers used for responses
+and stored data. The Rust-backed orjson is used when it is installed,
+with the standard library json module as a fallback.
+"""
+
+import json
+from typing import Any
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+# Try importing orjson (may not be available)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to JSON bytes.
+
+    Args:
+        obj: Object to serialize.
+        indent: Pretty-print with two-space indentation.
+
+    Returns:
+        UTF-8 encoded JSON document (compact unless indented, like orjson).
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON document as str or bytes.
+
+    Returns:
+        Deserialized Python object.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class JSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes responses with orjson when available."""
+
+    # API clients don't depend on key order or whitespace; keep responses
+    # small and skip sorting, in debug mode too
+    sort_keys = False
+    compact = True
+
+    def _orjson_dumps(self, obj: Any) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # Pretty-printing (debug mode) goes through the stdlib path
+        if not ORJSON_AVAILABLE or kwargs.get("indent"):
+            return super().dumps(obj, **kwargs)
+        return self._orjson_dumps(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if not ORJSON_AVAILABLE or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        if not ORJSON_AVAILABLE or pretty:
+            return super().response(*args, **kwargs)
+
+        # Hand orjson's bytes straight to the response (no str round-trip)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            self._orjson_dumps(obj) + b"\n", mimetype=self.mimetype
+        )
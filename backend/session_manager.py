@@ -7,16 +7,29 @@ of credentials, and persistent storage in database.
 
 import secrets
 import logging
-from typing import Optional, Dict, Any
-
-from constants import SESSION_ID_LENGTH
+import threading
+from typing import Optional, Dict, Any, Tuple
+
+from flask import g, has_request_context
+
+from cache import TTLCache
+from constants import (
+    SESSION_ID_LENGTH,
+    SESSION_EXPIRY_HOURS,
+    MAX_CACHED_SESSIONS,
+    SESSION_CACHE_SIZE,
+    SESSION_CACHE_SECONDS,
+    SESSION_CACHE_SWEEP_SECONDS,
+)
 from config import Config
+from twitter_client import TwitterClientManager
 
 # Import database manager (may not be available if Supabase not configured)
 try:
-    from database import database_manager
+    from database import database_manager, purge_expired_caches
 except (ImportError, AttributeError):
     database_manager = None
+    purge_expired_caches = None
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +45,46 @@ class SessionManager:
     def __init__(self):
         """Initialize the session manager with database-backed storage."""
         self._database_available = database_manager and database_manager.is_available()
+        # Twitter identity (user_id, username) per session; it never changes
+        # for a credential set, so it is fetched from the API at most once
+        self._identities: TTLCache[Tuple[str, str]] = TTLCache(
+            maxsize=MAX_CACHED_SESSIONS, ttl=SESSION_EXPIRY_HOURS * 3600
+        )
+        # Decrypted credentials of recently used sessions, kept briefly so
+        # bursts of read requests skip the database round trip. Each worker
+        # has its own copy, so state-changing requests bypass it (confirm)
+        self._credentials: TTLCache[Dict[str, str]] = TTLCache(
+            maxsize=SESSION_CACHE_SIZE, ttl=SESSION_CACHE_SECONDS
+        )
+        self._schedule_sweep()
+
+    def _schedule_sweep(self) -> None:
+        """Run _sweep after SESSION_CACHE_SWEEP_SECONDS on a daemon timer."""
+        timer = threading.Timer(SESSION_CACHE_SWEEP_SECONDS, self._sweep)
+        timer.daemon = True
+        timer.start()
+
+    def _sweep(self) -> None:
+        """
+        Drop expired per-session cache entries and schedule the next sweep.
+
+        Sessions that are never looked up again (abandoned tabs) would
+        otherwise keep their credentials, keys and API clients in memory
+        until evicted. Covers this manager's caches, the database module's
+        key caches and the Twitter client caches.
+        """
+        try:
+            removed = (
+                self._credentials.purge_expired()
+                + self._identities.purge_expired()
+                + TwitterClientManager.purge_expired()
+            )
+            if purge_expired_caches is not None:
+                removed += purge_expired_caches()
+            if removed:
+                logger.debug(f"Purged {removed} expired session cache entries")
+        finally:
+            self._schedule_sweep()
 
     def create_session(self, credentials: Dict[str, str]) -> str:
         """
@@ -60,6 +113,7 @@ class SessionManager:
                 if not success:
                     logger.error("Failed to save credentials to database")
                     raise Exception("Failed to persist credentials")
+                self._credentials.set(session_id, dict(credentials))
                 logger.info(f"Created new session and saved to database: {session_id[:8]}...")
             except Exception as e:
                 logger.error(f"Failed to save session to database: {e}")
@@ -70,12 +124,73 @@ class SessionManager:
 
         return session_id
 
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def load_for_request(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a session's stored data, at most once per HTTP request.
+
+        The result (including a miss) is kept on flask.g, so the session
+        check and later progress lookups in the same request share one
+        database read. Outside a request, the database is always read.
+
+        Args:
+            session_id: Session ID.
+
+        Returns:
+            Dictionary with 'credentials', 'day' and 'thread_id' keys, or
+            None if the session doesn't exist.
+        """
+        if not has_request_context():
+            return database_manager.load_user_data(session_id)
+
+        loaded = g.setdefault("_session_data", {})
+        if session_id not in loaded:
+            loaded[session_id] = database_manager.load_user_data(session_id)
+        return loaded[session_id]
+
+    def discard_request_data(self, session_id: str) -> None:
+        """
+        Forget data loaded by load_for_request, e.g. after progress is saved.
+
+        Args:
+            session_id: Session ID.
+        """
+        if has_request_context():
+            g.get("_session_data", {}).pop(session_id, None)
+
+    def _load_credentials(
+        self, session_id: str, confirm: bool = False
+    ) -> Optional[Dict[str, str]]:
+        """
+        Get a session's credentials from the cache or the database.
+
+        Args:
+            session_id: Session ID.
+            confirm: Read the database even on a cache hit, so a session
+                deleted through another worker is not accepted.
+
+        Returns:
+            Copy of the decrypted credentials, or None if the session doesn't exist.
+
+        Raises:
+            Exception: If loading from the database fails.
+        """
+        credentials = None if confirm else self._credentials.get(session_id)
+        if credentials is None:
+            user_data = self.load_for_request(session_id)
+            credentials = user_data.get("credentials") if user_data else None
+            if not credentials:
+                self.invalidate(session_id)
+                return None
+            self._credentials.set(session_id, credentials)
+        return dict(credentials)
+
+    def get_session(self, session_id: str, confirm: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get session data from database if it exists.
 
         Args:
             session_id: Session ID to retrieve.
+            confirm: Check the database even if the session is cached.
 
         Returns:
             Session data dictionary if valid, None otherwise.
@@ -87,10 +202,10 @@ class SessionManager:
             return None
 
         try:
-            user_data = database_manager.load_user_data(session_id)
-            if user_data:
+            credentials = self._load_credentials(session_id, confirm)
+            if credentials:
                 return {
-                    "credentials": user_data.get("credentials"),
+                    "credentials": credentials,
                     "created_at": None,  # Not tracking creation time anymore
                     "expires_at": None,  # No expiry - persistent until disconnect
                 }
@@ -119,14 +234,49 @@ class SessionManager:
             return None
 
         try:
-            user_data = database_manager.load_user_data(session_id)
-            if user_data:
-                return user_data.get("credentials")
-            return None
+            return self._load_credentials(session_id)
         except Exception as e:
             logger.error(f"Failed to get credentials for session {session_id[:8]}...: {e}")
             raise
 
+    def get_identity(self, session_id: str) -> Optional[Tuple[str, str]]:
+        """
+        Get the cached Twitter identity for a session.
+
+        Args:
+            session_id: Session ID.
+
+        Returns:
+            Tuple of (user_id, username) if cached, None otherwise.
+        """
+        return self._identities.get(session_id)
+
+    def set_identity(self, session_id: str, user_id: str, username: str) -> None:
+        """
+        Cache the Twitter identity for a session.
+
+        Args:
+            session_id: Session ID.
+            user_id: Authenticated user's ID.
+            username: Authenticated user's username.
+        """
+        self._identities.set(session_id, (user_id, username))
+
+    def invalidate(self, session_id: str) -> None:
+        """
+        Drop cached data for a session, so the next lookup reads the database.
+
+        The session's Twitter client is evicted too, if its credentials are
+        cached; otherwise none was used recently enough to still be cached.
+
+        Args:
+            session_id: Session ID.
+        """
+        credentials = self._credentials.pop(session_id)
+        self._identities.pop(session_id)
+        if credentials:
+            TwitterClientManager.invalidate(credentials)
+
     def delete_session(self, session_id: str) -> bool:
         """
         Delete a session and all associated data from database.
@@ -142,6 +292,8 @@ class SessionManager:
         if not session_id:
             return False
 
+        self.invalidate(session_id)
+
         if not self._database_available:
             logger.warning("Database not available, cannot delete session")
             return False
@@ -159,13 +311,16 @@ class SessionManager:
         """
         Check if a session exists in the database.
 
+        Always reads the database, since the session may have been deleted
+        through another worker.
+
         Args:
             session_id: Session ID to check.
 
         Returns:
             True if session is valid, False otherwise.
         """
-        return self.get_session(session_id) is not None
+        return self.get_session(session_id, confirm=True) is not None
 
 
 # Global session manager instance
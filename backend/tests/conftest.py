@@ -0,0 +1,11 @@
+"""
+Pytest configuration for ThreadCraft backend tests.
+
+The backend modules import each other as top-level modules (as they do when
+run from backend/), so backend/ is put on sys.path.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,70 @@
+"""Tests for error classification in errors."""
+
+from typing import Optional
+
+import pytest
+
+from errors import classify_error, error_matches, friendly_error_message
+
+# Original keyword if-chain, in priority order
+BASELINE_CHAIN = (
+    ("AUTHENTICATION_FAILED", ("unauthorized", "401")),
+    ("PERMISSION_DENIED", ("forbidden", "403")),
+    ("RATE_LIMITED", ("rate limit", "429")),
+    ("DUPLICATE_TWEET", ("duplicate",)),
+    ("TWEET_TOO_LONG", ("too long", "character")),
+    ("CONNECTION_ERROR", ("connection", "timeout", "network")),
+    ("NOT_FOUND", ("not found", "404")),
+)
+
+
+def baseline_classify(message: str) -> Optional[str]:
+    """Original behaviour: first category with a keyword in the message."""
+    error_str = message.lower()
+    for error_code, keywords in BASELINE_CHAIN:
+        if any(keyword in error_str for keyword in keywords):
+            return error_code
+    return None
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "40401",
+        "429 Too Many Requests",
+        "401 Unauthorized",
+        "403 Forbidden",
+        "404 Not Found",
+        "Rate limit exceeded",
+        "RATE LIMIT",
+        "Connection timeout",
+        "Tweet text is too long",
+        "Duplicate content",
+        "4290",
+        "Not Found: duplicate 403",
+        "Network unreachable after 404",
+        "something unexpected",
+        "",
+    ],
+)
+def test_classify_error_matches_baseline(message):
+    assert classify_error(Exception(message)) == baseline_classify(message)
+
+
+def test_overlapping_keywords_keep_priority():
+    # "404" overlaps "401"; the higher-priority authentication code wins
+    assert classify_error(Exception("40401")) == "AUTHENTICATION_FAILED"
+
+
+def test_rate_limited():
+    assert classify_error(Exception("429")) == "RATE_LIMITED"
+
+
+def test_unknown_error():
+    assert friendly_error_message(Exception("boom"))[0] == "UNKNOWN_ERROR"
+
+
+def test_error_matches_ignores_priority():
+    error = Exception("401 ... 404 Not Found")
+    assert classify_error(error) == "AUTHENTICATION_FAILED"
+    assert error_matches(error, "NOT_FOUND")
@@ -0,0 +1,58 @@
+"""Tests for the single-pass day extraction in utils."""
+
+import re
+from typing import Iterable, Optional
+
+import pytest
+
+from constants import DAY_PATTERN_REGEX
+from utils import extract_day_from_text, extract_highest_day
+
+
+def baseline_highest_day(texts: Iterable[str]) -> Optional[int]:
+    """Original behaviour: first "Day N" of each text, highest across texts."""
+    day_numbers = []
+    for text in texts:
+        match = re.search(DAY_PATTERN_REGEX, text or "", re.IGNORECASE)
+        if match:
+            day_numbers.append(int(match.group(1)))
+    return max(day_numbers) if day_numbers else None
+
+
+@pytest.mark.parametrize(
+    "texts",
+    [
+        [],
+        [""],
+        ["no day mentioned here", "still nothing"],
+        ["Day 3"],
+        ["Day 3 follows Day 9"],
+        ["Day 12 recap", "Day 4", "day 30 done"],
+        ["DAY 7", "dAy 11", "day\t2"],
+        ["Today 5", "Day5", "Day  8"],
+        ["Day 2\nDay 40", "nothing", "Day 6"],
+        ["Friday 9 and Day 1"],
+        ["Day 007", "Day 10"],
+    ],
+)
+def test_extract_highest_day_matches_baseline(texts):
+    assert extract_highest_day(texts) == baseline_highest_day(texts)
+
+
+def test_extract_highest_day_uses_first_mention_per_text():
+    # A later, higher mention in the same text doesn't count
+    assert extract_highest_day(["Day 3 then Day 9", "Day 5"]) == 5
+
+
+def test_extract_highest_day_no_match():
+    assert extract_highest_day(["nothing", "at all"]) is None
+
+
+def test_extract_highest_day_accepts_generator():
+    texts = ["Day 1", "Day 14", "Day 2"]
+    assert extract_highest_day(text for text in texts) == 14
+
+
+@pytest.mark.parametrize("text", ["Day 1", "day 20", "DAY 3 and Day 4", "none", ""])
+def test_extract_day_from_text_matches_baseline(text):
+    assert extract_day_from_text(text) == baseline_highest_day([text])
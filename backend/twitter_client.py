@@ -4,21 +4,82 @@ Twitter API client management for ThreadCraft backend.
 This module provides utilities for creating and using Twitter API clients.
 """
 
+import hashlib
 import logging
-from typing import Dict, Optional
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Optional, Tuple
 
+import requests
 import tweepy
+from requests.adapters import HTTPAdapter
+
+from cache import TTLCache
+from errors import classify_error
+from constants import (
+    MAX_CACHED_SESSIONS,
+    SESSION_EXPIRY_HOURS,
+    SESSION_CACHE_SECONDS,
+    CREDENTIAL_VALIDATION_CACHE_SIZE,
+    CREDENTIAL_VALIDATION_CACHE_SECONDS,
+    REQUIRED_CREDENTIAL_FIELDS,
+    REQUIRED_CREDENTIAL_FIELDS_SET,
+    TWITTER_HTTP_POOL_SIZE,
+)
 
 logger = logging.getLogger(__name__)
 
+# One keep-alive connection pool shared by every client. tweepy sends the
+# OAuth/bearer auth with each request rather than storing it on the session,
+# and cookies are refused so nothing carries over between accounts.
+_http_session = requests.Session()
+_http_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_http_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=TWITTER_HTTP_POOL_SIZE, pool_block=False),
+)
+
 
 class TwitterClientManager:
     """Manages Twitter API client creation and operations."""
 
+    # Clients are shared process-wide per credential set. They hold the
+    # keys, so they are kept only as long as the session credential cache;
+    # keep-alive connections live on the shared _http_session regardless
+    _client_cache: TTLCache[tweepy.Client] = TTLCache(
+        maxsize=MAX_CACHED_SESSIONS, ttl=SESSION_CACHE_SECONDS
+    )
+    # Identity (user_id, username) returned by get_me during validation
+    _identity_cache: TTLCache[Tuple[str, str]] = TTLCache(
+        maxsize=MAX_CACHED_SESSIONS, ttl=SESSION_EXPIRY_HOURS * 3600
+    )
+    # Recent (is_valid, error_message) results, so resubmitting the same keys
+    # doesn't spend another API call (and rate limit); kept short so revoked
+    # or regenerated keys are noticed soon
+    _validation_cache: TTLCache[Tuple[bool, Optional[str]]] = TTLCache(
+        maxsize=CREDENTIAL_VALIDATION_CACHE_SIZE, ttl=CREDENTIAL_VALIDATION_CACHE_SECONDS
+    )
+
     @staticmethod
-    def create_client(credentials: Dict[str, str]) -> tweepy.Client:
+    def _fingerprint(credentials: Dict[str, str]) -> str:
         """
-        Create a Twitter API client with provided credentials.
+        Build a cache key for a credential set without keeping the secrets.
+
+        Args:
+            credentials: Dictionary containing Twitter API credentials.
+
+        Returns:
+            Hex digest identifying the credential set.
+        """
+        joined = "\0".join(credentials.get(field) or "" for field in REQUIRED_CREDENTIAL_FIELDS)
+        return hashlib.blake2b(joined.encode(), digest_size=16).hexdigest()
+
+    @classmethod
+    def create_client(cls, credentials: Dict[str, str]) -> tweepy.Client:
+        """
+        Get a Twitter API client for the provided credentials.
+
+        Clients are cached by credential set, so repeated calls return the
+        same instance.
 
         Args:
             credentials: Dictionary containing Twitter API credentials:
@@ -34,16 +95,14 @@ class TwitterClientManager:
         Raises:
             ValueError: If required credentials are missing.
         """
-        required_fields = [
-            "bearer_token",
-            "api_key",
-            "api_secret",
-            "access_token",
-            "access_token_secret",
-        ]
-
-        missing_fields = [field for field in required_fields if not credentials.get(field)]
-        if missing_fields:
+        fingerprint = cls._fingerprint(credentials)
+        client = cls._client_cache.get(fingerprint)
+        if client is not None:
+            return client
+
+        missing = REQUIRED_CREDENTIAL_FIELDS_SET - {k for k, v in credentials.items() if v}
+        if missing:
+            missing_fields = [f for f in REQUIRED_CREDENTIAL_FIELDS if f in missing]
             raise ValueError(f"Missing required credentials: {', '.join(missing_fields)}")
 
         try:
@@ -54,33 +113,95 @@ class TwitterClientManager:
                 access_token=credentials.get("access_token"),
                 access_token_secret=credentials.get("access_token_secret"),
             )
+            client.session = _http_session
             logger.debug("Twitter client created successfully")
+            cls._client_cache.set(fingerprint, client)
             return client
         except Exception as e:
             logger.error(f"Failed to create Twitter client: {e}")
             raise
 
+    @classmethod
+    def invalidate(cls, credentials: Dict[str, str]) -> None:
+        """
+        Drop the cached client for a credential set.
+
+        Args:
+            credentials: Dictionary containing Twitter API credentials.
+        """
+        fingerprint = cls._fingerprint(credentials)
+        cls._client_cache.pop(fingerprint)
+        cls._identity_cache.pop(fingerprint)
+        cls._validation_cache.pop(fingerprint)
+
+    @classmethod
+    def purge_expired(cls) -> int:
+        """
+        Remove expired clients, identities and validation results.
+
+        Returns:
+            Number of entries removed.
+        """
+        return (
+            cls._client_cache.purge_expired()
+            + cls._identity_cache.purge_expired()
+            + cls._validation_cache.purge_expired()
+        )
+
+    @classmethod
+    def get_identity(cls, credentials: Dict[str, str]) -> Optional[Tuple[str, str]]:
+        """
+        Get the identity seen when a credential set was last validated.
+
+        Args:
+            credentials: Dictionary containing Twitter API credentials.
+
+        Returns:
+            Tuple of (user_id, username), or None if not known.
+        """
+        return cls._identity_cache.get(cls._fingerprint(credentials))
+
     @staticmethod
     def validate_credentials(credentials: Dict[str, str]) -> tuple[bool, Optional[str]]:
         """
         Validate Twitter API credentials by attempting to authenticate.
 
+        Credential sets that recently passed or failed authentication are
+        answered from cache without calling the API.
+
         Args:
             credentials: Dictionary containing Twitter API credentials.
 
         Returns:
             Tuple of (is_valid, error_message). error_message is None if valid.
         """
+        fingerprint = TwitterClientManager._fingerprint(credentials)
+        cached = TwitterClientManager._validation_cache.get(fingerprint)
+        if cached is not None:
+            return cached
+
         try:
             client = TwitterClientManager.create_client(credentials)
-            client.get_me()
+            me = client.get_me()
+            TwitterClientManager._identity_cache.set(
+                fingerprint, (str(me.data.id), me.data.username)
+            )
             logger.debug("Credentials validated successfully")
+            TwitterClientManager._validation_cache.set(fingerprint, (True, None))
             return True, None
         except Exception as e:
-            error_msg = str(e).lower()
-            if "unauthorized" in error_msg or "401" in error_msg:
-                return False, "Invalid API credentials. Please check your keys."
-            elif "forbidden" in error_msg or "403" in error_msg:
+            error_code = classify_error(e)
+            # Don't keep a client around for credentials that don't work.
+            # Rate limits and network errors say nothing about the keys, and
+            # other sessions may be using the cached client and identity.
+            if error_code in ("AUTHENTICATION_FAILED", "PERMISSION_DENIED"):
+                TwitterClientManager.invalidate(credentials)
+            if error_code == "AUTHENTICATION_FAILED":
+                result = (False, "Invalid API credentials. Please check your keys.")
+                TwitterClientManager._validation_cache.set(fingerprint, result)
+                return result
+            elif error_code == "PERMISSION_DENIED":
+                # Not cached: fixing app permissions doesn't rotate the keys
                 return False, "API credentials do not have required permissions."
             else:
                 logger.error(f"Credential validation failed: {e}")
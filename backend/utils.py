@@ -7,18 +7,27 @@ such as validation, URL parsing, and error handling.
 
 import re
 import logging
-from typing import Optional, Tuple
-from urllib.parse import urlparse, parse_qs
+from typing import Iterable, Optional, Tuple
 
 from constants import (
-    THREAD_URL_STATUS_PATTERN,
+    THREAD_URL_STATUS_RE,
     X_COM_DOMAIN,
     TWITTER_COM_DOMAIN,
+    DAY_PATTERN,
     DAY_PATTERN_REGEX,
 )
 
 logger = logging.getLogger(__name__)
 
+_STATUS_SEGMENT = "/status/"
+
+# Separator for scanning many texts in one pass; the pattern below takes
+# the first day match after each separator, like extract_day_from_text
+_TEXT_SEPARATOR = "\0"
+_FIRST_DAY_PER_TEXT_RE = re.compile(
+    rf"(?:^|{_TEXT_SEPARATOR})[^{_TEXT_SEPARATOR}]*?{DAY_PATTERN_REGEX}", re.IGNORECASE
+)
+
 
 def extract_thread_id_from_url(url: str) -> Optional[str]:
     """
@@ -45,30 +54,29 @@ def extract_thread_id_from_url(url: str) -> Optional[str]:
     if url.isdigit():
         return url
 
-    # Check if it's a URL
+    # Fast path: the ID runs from "/status/" to the next "/" or "?", and
+    # only the part before "/status/" needs checking for the domain
+    idx = url.find(_STATUS_SEGMENT)
+    if idx != -1:
+        host_part = url[:idx]
+        if X_COM_DOMAIN in host_part or TWITTER_COM_DOMAIN in host_part:
+            thread_id = url[idx + len(_STATUS_SEGMENT):].split("?", 1)[0].split("/", 1)[0]
+            # isdecimal matches what the regex's \d accepts
+            if thread_id.isdecimal():
+                logger.debug(f"Extracted thread ID {thread_id} from URL: {url}")
+                return thread_id
+
+    # Check if it's a URL (non-numeric and not on a known domain: invalid)
     if X_COM_DOMAIN not in url and TWITTER_COM_DOMAIN not in url:
-        # Not a URL, might be an ID or invalid
-        return url if url.isdigit() else None
+        return None
 
-    # Extract ID using regex from URL pattern
-    match = re.search(THREAD_URL_STATUS_PATTERN, url)
+    # Extract ID using regex from URL pattern (covers any .../status/<id> path)
+    match = THREAD_URL_STATUS_RE.search(url)
     if match:
         thread_id = match.group(1)
         logger.debug(f"Extracted thread ID {thread_id} from URL: {url}")
         return thread_id
 
-    # Fallback: try to extract from URL path
-    try:
-        parsed = urlparse(url)
-        path_parts = [p for p in parsed.path.split("/") if p]
-        if len(path_parts) >= 2 and path_parts[-2] == "status":
-            thread_id = path_parts[-1].split("?")[0]  # Remove query params
-            if thread_id.isdigit():
-                logger.debug(f"Extracted thread ID {thread_id} from URL path: {url}")
-                return thread_id
-    except Exception as e:
-        logger.warning(f"Failed to parse URL {url}: {e}")
-
     logger.warning(f"Could not extract thread ID from URL: {url}")
     return None
 
@@ -88,7 +96,7 @@ def extract_day_from_text(text: str) -> Optional[int]:
     if not text:
         return None
 
-    match = re.search(DAY_PATTERN_REGEX, text, re.IGNORECASE)
+    match = DAY_PATTERN.search(text)
     if match:
         try:
             return int(match.group(1))
@@ -98,6 +106,40 @@ def extract_day_from_text(text: str) -> Optional[int]:
     return None
 
 
+def extract_highest_day(texts: Iterable[str]) -> Optional[int]:
+    """
+    Find the highest day number across several texts.
+
+    Equivalent to taking the max of extract_day_from_text over the texts,
+    but scans them with a single regex pass.
+
+    Args:
+        texts: Texts to search for day patterns.
+
+    Returns:
+        Highest day number found, or None if no text contains one.
+    """
+    joined = _TEXT_SEPARATOR.join(texts)
+    return max(map(int, _FIRST_DAY_PER_TEXT_RE.findall(joined)), default=None)
+
+
+def format_solution_tweet(day: int, problem_name: str, gist_url: str) -> str:
+    """
+    Build the text of a daily solution tweet.
+
+    Args:
+        day: Day number being posted.
+        problem_name: Name of the LeetCode problem.
+        gist_url: GitHub Gist URL for the solution.
+
+    Returns:
+        Tweet text.
+    """
+    # A single f-string is built in one pass; it benchmarks faster than
+    # str.join over the three parts
+    return f"Day {day}\n\n{problem_name}\n\n{gist_url}"
+
+
 def validate_tweet_length(text: str, max_length: int = 280) -> Tuple[bool, Optional[str]]:
     """
     Validate tweet text length.